@@ -1,20 +1,15 @@
 # mypy: disable-error-code="attr-defined"
 """ASTx."""
 
-from importlib import metadata as importlib_metadata
+from __future__ import annotations
 
-from astx import (
-    base,
-    blocks,
-    callables,
-    flows,
-    literals,
-    mixes,
-    packages,
-    symbol_table,
-    types,
-    variables,
-)
+import importlib
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from astx import base
+from astx._version import version as _version
 from astx.base import (
     AST,
     ASTKind,
@@ -28,141 +23,301 @@ from astx.base import (
     StatementType,
     Undefined,
 )
-from astx.blocks import (
-    Block,
-)
-from astx.callables import (
-    Argument,
-    Arguments,
-    Function,
-    FunctionCall,
-    FunctionPrototype,
-    FunctionReturn,
-    LambdaExpr,
-)
-from astx.classes import (
-    ClassDeclStmt,
-    ClassDefStmt,
-    EnumDeclStmt,
-    StructDeclStmt,
-    StructDefStmt,
-)
-from astx.exceptions import (
-    CatchHandlerStmt,
-    ExceptionHandlerStmt,
-    FinallyHandlerStmt,
-    ThrowStmt,
-)
-from astx.flows import (
-    CaseStmt,
-    ForCountLoopExpr,
-    ForCountLoopStmt,
-    ForRangeLoopExpr,
-    ForRangeLoopStmt,
-    GotoStmt,
-    IfExpr,
-    IfStmt,
-    SwitchStmt,
-    WhileExpr,
-    WhileStmt,
-    YieldExpr,
-)
-from astx.literals import (
-    Literal,
-    LiteralBoolean,
-    LiteralComplex,
-    LiteralComplex32,
-    LiteralComplex64,
-    LiteralDate,
-    LiteralDateTime,
-    LiteralFloat16,
-    LiteralFloat32,
-    LiteralFloat64,
-    LiteralInt8,
-    LiteralInt16,
-    LiteralInt32,
-    LiteralInt64,
-    LiteralInt128,
-    LiteralNone,
-    LiteralString,
-    LiteralTime,
-    LiteralTimestamp,
-    LiteralUInt8,
-    LiteralUInt16,
-    LiteralUInt32,
-    LiteralUInt64,
-    LiteralUInt128,
-    LiteralUTF8Char,
-    LiteralUTF8String,
-)
-from astx.mixes import (
-    NamedExpr,
-)
-from astx.modifiers import (
-    MutabilityKind,
-    ScopeKind,
-    VisibilityKind,
-)
-from astx.operators import AssignmentExpr, VariableAssignment, WalrusOp
-from astx.packages import (
-    AliasExpr,
-    ImportExpr,
-    ImportFromExpr,
-    ImportFromStmt,
-    ImportStmt,
-    Module,
-    Package,
-    Program,
-    Target,
-)
-from astx.subscript import SubscriptExpr
-from astx.types import (
-    BinaryOp,
-    Boolean,
-    Complex,
-    Complex32,
-    Complex64,
-    DataTypeOps,
-    Date,
-    DateTime,
-    Float16,
-    Float32,
-    Float64,
-    Floating,
-    Int8,
-    Int16,
-    Int32,
-    Int64,
-    Integer,
-    Number,
-    SignedInteger,
-    String,
-    Time,
-    Timestamp,
-    TypeCastExpr,
-    UInt8,
-    UInt16,
-    UInt32,
-    UInt64,
-    UInt128,
-    UnaryOp,
-    UnsignedInteger,
-    UTF8Char,
-    UTF8String,
-)
-from astx.variables import (
-    InlineVariableDeclaration,
-    Variable,
-    VariableDeclaration,
-)
+
+if TYPE_CHECKING:
+    from astx import (
+        blocks,
+        callables,
+        classes,
+        exceptions,
+        flows,
+        literals,
+        mixes,
+        modifiers,
+        operators,
+        packages,
+        subscript,
+        symbol_table,
+        types,
+        variables,
+    )
+    from astx.blocks import (
+        Block,
+    )
+    from astx.callables import (
+        Argument,
+        Arguments,
+        Function,
+        FunctionCall,
+        FunctionPrototype,
+        FunctionReturn,
+        LambdaExpr,
+    )
+    from astx.classes import (
+        ClassDeclStmt,
+        ClassDefStmt,
+        EnumDeclStmt,
+        StructDeclStmt,
+        StructDefStmt,
+    )
+    from astx.exceptions import (
+        CatchHandlerStmt,
+        ExceptionHandlerStmt,
+        FinallyHandlerStmt,
+        ThrowStmt,
+    )
+    from astx.flows import (
+        CaseStmt,
+        ForCountLoopExpr,
+        ForCountLoopStmt,
+        ForRangeLoopExpr,
+        ForRangeLoopStmt,
+        GotoStmt,
+        IfExpr,
+        IfStmt,
+        SwitchStmt,
+        WhileExpr,
+        WhileStmt,
+        YieldExpr,
+    )
+    from astx.literals import (
+        Literal,
+        LiteralBoolean,
+        LiteralComplex,
+        LiteralComplex32,
+        LiteralComplex64,
+        LiteralDate,
+        LiteralDateTime,
+        LiteralFloat16,
+        LiteralFloat32,
+        LiteralFloat64,
+        LiteralInt8,
+        LiteralInt16,
+        LiteralInt32,
+        LiteralInt64,
+        LiteralInt128,
+        LiteralNone,
+        LiteralString,
+        LiteralTime,
+        LiteralTimestamp,
+        LiteralUInt8,
+        LiteralUInt16,
+        LiteralUInt32,
+        LiteralUInt64,
+        LiteralUInt128,
+        LiteralUTF8Char,
+        LiteralUTF8String,
+    )
+    from astx.mixes import (
+        NamedExpr,
+    )
+    from astx.modifiers import (
+        MutabilityKind,
+        ScopeKind,
+        VisibilityKind,
+    )
+    from astx.operators import AssignmentExpr, VariableAssignment, WalrusOp
+    from astx.packages import (
+        AliasExpr,
+        ImportExpr,
+        ImportFromExpr,
+        ImportFromStmt,
+        ImportStmt,
+        Module,
+        Package,
+        Program,
+        Target,
+    )
+    from astx.subscript import SubscriptExpr
+    from astx.types import (
+        BinaryOp,
+        Boolean,
+        Complex,
+        Complex32,
+        Complex64,
+        DataTypeOps,
+        Date,
+        DateTime,
+        Float16,
+        Float32,
+        Float64,
+        Floating,
+        Int8,
+        Int16,
+        Int32,
+        Int64,
+        Integer,
+        Number,
+        SignedInteger,
+        String,
+        Time,
+        Timestamp,
+        TypeCastExpr,
+        UInt8,
+        UInt16,
+        UInt32,
+        UInt64,
+        UInt128,
+        UnaryOp,
+        UnsignedInteger,
+        UTF8Char,
+        UTF8String,
+    )
+    from astx.variables import (
+        InlineVariableDeclaration,
+        Variable,
+        VariableDeclaration,
+    )
+
+# names exported by the package that are only imported on first access,
+# mapped to the module that defines them (submodules map to themselves)
+_LAZY_IMPORTS: dict[str, str] = {
+    "blocks": "astx.blocks",
+    "callables": "astx.callables",
+    "classes": "astx.classes",
+    "exceptions": "astx.exceptions",
+    "flows": "astx.flows",
+    "literals": "astx.literals",
+    "mixes": "astx.mixes",
+    "modifiers": "astx.modifiers",
+    "operators": "astx.operators",
+    "packages": "astx.packages",
+    "subscript": "astx.subscript",
+    "symbol_table": "astx.symbol_table",
+    "types": "astx.types",
+    "variables": "astx.variables",
+    "Block": "astx.blocks",
+    "Argument": "astx.callables",
+    "Arguments": "astx.callables",
+    "Function": "astx.callables",
+    "FunctionCall": "astx.callables",
+    "FunctionPrototype": "astx.callables",
+    "FunctionReturn": "astx.callables",
+    "LambdaExpr": "astx.callables",
+    "ClassDeclStmt": "astx.classes",
+    "ClassDefStmt": "astx.classes",
+    "EnumDeclStmt": "astx.classes",
+    "StructDeclStmt": "astx.classes",
+    "StructDefStmt": "astx.classes",
+    "CatchHandlerStmt": "astx.exceptions",
+    "ExceptionHandlerStmt": "astx.exceptions",
+    "FinallyHandlerStmt": "astx.exceptions",
+    "ThrowStmt": "astx.exceptions",
+    "CaseStmt": "astx.flows",
+    "ForCountLoopExpr": "astx.flows",
+    "ForCountLoopStmt": "astx.flows",
+    "ForRangeLoopExpr": "astx.flows",
+    "ForRangeLoopStmt": "astx.flows",
+    "GotoStmt": "astx.flows",
+    "IfExpr": "astx.flows",
+    "IfStmt": "astx.flows",
+    "SwitchStmt": "astx.flows",
+    "WhileExpr": "astx.flows",
+    "WhileStmt": "astx.flows",
+    "YieldExpr": "astx.flows",
+    "Literal": "astx.literals",
+    "LiteralBoolean": "astx.literals",
+    "LiteralComplex": "astx.literals",
+    "LiteralComplex32": "astx.literals",
+    "LiteralComplex64": "astx.literals",
+    "LiteralDate": "astx.literals",
+    "LiteralDateTime": "astx.literals",
+    "LiteralFloat16": "astx.literals",
+    "LiteralFloat32": "astx.literals",
+    "LiteralFloat64": "astx.literals",
+    "LiteralInt8": "astx.literals",
+    "LiteralInt16": "astx.literals",
+    "LiteralInt32": "astx.literals",
+    "LiteralInt64": "astx.literals",
+    "LiteralInt128": "astx.literals",
+    "LiteralNone": "astx.literals",
+    "LiteralString": "astx.literals",
+    "LiteralTime": "astx.literals",
+    "LiteralTimestamp": "astx.literals",
+    "LiteralUInt8": "astx.literals",
+    "LiteralUInt16": "astx.literals",
+    "LiteralUInt32": "astx.literals",
+    "LiteralUInt64": "astx.literals",
+    "LiteralUInt128": "astx.literals",
+    "LiteralUTF8Char": "astx.literals",
+    "LiteralUTF8String": "astx.literals",
+    "NamedExpr": "astx.mixes",
+    "MutabilityKind": "astx.modifiers",
+    "ScopeKind": "astx.modifiers",
+    "VisibilityKind": "astx.modifiers",
+    "AssignmentExpr": "astx.operators",
+    "VariableAssignment": "astx.operators",
+    "WalrusOp": "astx.operators",
+    "AliasExpr": "astx.packages",
+    "ImportExpr": "astx.packages",
+    "ImportFromExpr": "astx.packages",
+    "ImportFromStmt": "astx.packages",
+    "ImportStmt": "astx.packages",
+    "Module": "astx.packages",
+    "Package": "astx.packages",
+    "Program": "astx.packages",
+    "Target": "astx.packages",
+    "SubscriptExpr": "astx.subscript",
+    "BinaryOp": "astx.types",
+    "Boolean": "astx.types",
+    "Complex": "astx.types",
+    "Complex32": "astx.types",
+    "Complex64": "astx.types",
+    "DataTypeOps": "astx.types",
+    "Date": "astx.types",
+    "DateTime": "astx.types",
+    "Float16": "astx.types",
+    "Float32": "astx.types",
+    "Float64": "astx.types",
+    "Floating": "astx.types",
+    "Int8": "astx.types",
+    "Int16": "astx.types",
+    "Int32": "astx.types",
+    "Int64": "astx.types",
+    "Integer": "astx.types",
+    "Number": "astx.types",
+    "SignedInteger": "astx.types",
+    "String": "astx.types",
+    "Time": "astx.types",
+    "Timestamp": "astx.types",
+    "TypeCastExpr": "astx.types",
+    "UInt8": "astx.types",
+    "UInt16": "astx.types",
+    "UInt32": "astx.types",
+    "UInt64": "astx.types",
+    "UInt128": "astx.types",
+    "UnaryOp": "astx.types",
+    "UnsignedInteger": "astx.types",
+    "UTF8Char": "astx.types",
+    "UTF8String": "astx.types",
+    "InlineVariableDeclaration": "astx.variables",
+    "Variable": "astx.variables",
+    "VariableDeclaration": "astx.variables",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested name from its module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name)
+    value = module if module_name == f"astx.{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the names of the package, including the ones not loaded yet."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """Return the program version."""
-    try:
-        return importlib_metadata.version(__name__)
-    except importlib_metadata.PackageNotFoundError:  # pragma: no cover
-        return "0.17.0"  # semantic-release
+    # read from the module kept up to date by semantic-release instead of
+    # looking up the installed distribution metadata
+    return _version
 
 
 __all__ = [
@@ -287,12 +442,16 @@ __all__ = [
     "base",
     "blocks",
     "callables",
-    "datatypes",
+    "classes",
+    "exceptions",
     "flows",
     "get_version",
     "literals",
     "mixes",
+    "modifiers",
+    "operators",
     "packages",
+    "subscript",
     "symbol_table",
     "types",
     "variables",
@@ -0,0 +1,3 @@
+"""ASTx version, updated by semantic-release."""
+
+version = "0.17.0"  # semantic-release
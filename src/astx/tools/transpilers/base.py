@@ -0,0 +1,159 @@
+"""Base class for ASTx transpilers."""
+
+from enum import Enum
+from typing import Any, Callable, ClassVar, Sequence, TypeVar, Union
+
+import astx
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class Token(Enum):
+    """Instructions to the transpiler mixed with the generated code."""
+
+    INDENT = 1
+    DEDENT = 2
+
+
+Part = Union[str, astx.AST, type[astx.AST], Token]
+Handler = Callable[[Any, Any], Sequence[Part]]
+
+
+def register(*node_types: type) -> Callable[[_F], _F]:
+    """Register the decorated method as the visitor for the node types."""
+
+    def decorator(fn: _F) -> _F:
+        fn._node_types = node_types  # type: ignore[attr-defined]
+        return fn
+
+    return decorator
+
+
+class ASTxTranspiler:
+    """
+    Base class for transpilers that translate ASTx nodes to source code.
+
+    Visit methods are registered with the `register` decorator. The
+    node type -> visit method table is built once per class, when the
+    subclass is created, merging the tables from the parent classes.
+    Nodes without a handler for their own type use the handler of the
+    closest registered class in their MRO.
+
+    Visit methods don't generate the code of their children: they return
+    the parts of the code for the node, in order, where each part is either
+    a string, a child node, or a `Token`. The parts are pushed onto a work
+    stack and the tree is walked iteratively, writing the strings into a
+    single output buffer, so deep trees don't grow the Python call stack.
+
+    Data types may also be given as classes (e.g. `astx.Int32`) instead of
+    instances. Their code is looked up in the `_type_names` table.
+    """
+
+    # code for the data types, by data type class
+    _type_names: ClassVar[dict[type, str]] = {}
+
+    # explicitly registered visit methods
+    _registered: ClassVar[dict[type, Handler]] = {}
+    # registered visit methods plus the node types resolved through the MRO
+    _handlers: ClassVar[dict[type, Handler]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the handlers table for the new transpiler class."""
+        super().__init_subclass__(**kwargs)
+        # inherited visit methods are looked up again by name, so a plain
+        # override in the subclass replaces the parent's handler
+        registered = {
+            node_type: getattr(cls, fn.__name__)
+            for node_type, fn in cls._registered.items()
+        }
+        for fn in vars(cls).values():
+            for node_type in getattr(fn, "_node_types", ()):
+                registered[node_type] = fn
+        cls._registered = registered
+        cls._handlers = dict(registered)
+
+    def __init__(self) -> None:
+        self.indent_level = 0
+        self.indent_str = "    "  # 4 spaces
+        # indentation strings by level, extended on demand by Token.INDENT
+        self._indents: list[str] = [""]
+        self._buf: list[str] = []
+        # number of `visit` calls in progress; 0 between translations
+        self._depth = 0
+
+    def _indent(self, level: int) -> str:
+        """Return the indentation string for the given level."""
+        indents = self._indents
+        while len(indents) <= level:
+            indents.append(indents[-1] + self.indent_str)
+        return indents[level]
+
+    def _resolve_mro(self, node_type: type) -> Handler:
+        """Find the handler for the closest registered class in the MRO."""
+        handlers = type(self)._handlers
+        for cls in node_type.__mro__:
+            fn = handlers.get(cls)
+            if fn is not None:
+                handlers[node_type] = fn
+                return fn
+        raise Exception(f"Not implemented yet ({node_type.__name__}).")
+
+    def _type_name(self, node_type: type) -> str:
+        """Return the code for a data type class."""
+        type_names = self._type_names
+        for cls in node_type.__mro__:
+            name = type_names.get(cls)
+            if name is not None:
+                return name
+        raise Exception(f"Not implemented yet ({node_type.__name__}).")
+
+    def _visit(self, node: Union[astx.AST, type[astx.AST]]) -> None:
+        """Write the code for the given node into the output buffer."""
+        # this loop runs for every part of the generated code, so the
+        # methods it calls are bound to local names once, up front
+        emit = self._buf.append
+        get_handler = self._handlers.get
+        resolve_mro = self._resolve_mro
+        stack: list[Part] = [node]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            item = pop()
+            if isinstance(item, str):
+                emit(item)
+            elif item is Token.INDENT:
+                self.indent_level += 1
+            elif item is Token.DEDENT:
+                self.indent_level -= 1
+            elif isinstance(item, type):
+                emit(self._type_name(item))
+            else:
+                node_type = type(item)
+                fn = get_handler(node_type) or resolve_mro(node_type)
+                push(reversed(fn(self, item)))
+
+    def _reset(self) -> None:
+        """Clear the state left by the previous translation."""
+        self._buf.clear()
+        self.indent_level = 0
+
+    def transpile(self, root: Union[astx.AST, type[astx.AST]]) -> str:
+        """Translate an ASTx tree into source code."""
+        return self.visit(root)
+
+    def visit(self, node: Union[astx.AST, type[astx.AST]]) -> str:
+        """Translate an ASTx expression."""
+        if not self._depth:
+            # outermost call, so this is a new translation
+            self._reset()
+        start = len(self._buf)
+        indent_level = self.indent_level
+        self._depth += 1
+        try:
+            self._visit(node)
+            return "".join(self._buf[start:])
+        finally:
+            # also drop the partial output and indentation of a failed visit
+            del self._buf[start:]
+            self.indent_level = indent_level
+            self._depth -= 1
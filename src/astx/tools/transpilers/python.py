@@ -1,183 +1,261 @@
+# mypy: disable-error-code="attr-defined"
 """ASTx Python transpiler."""
 
-from typing import Union, cast
+import threading
 
-from plum import dispatch
+from typing import ClassVar, Iterable, Optional, Union, cast
 
 import astx
 
-from astx.tools.typing import typechecked
+from astx.tools.transpilers.base import ASTxTranspiler, Part, Token, register
 
+_IMPORT_TMPL = "__import__('%s') "
+_IMPORT_FROM_TMPL = "getattr(__import__('%s', fromlist=['%s']), '%s')"
 
-@typechecked
-class ASTxPythonTranspiler:
+
+class _OpFragments(dict[str, str]):
+    """Code fragments for operators, formatted once per operator code."""
+
+    def __init__(self, template: str, op_codes: Iterable[str]) -> None:
+        self.template = template
+        super().__init__((op, template % op) for op in op_codes)
+
+    def __missing__(self, op_code: str) -> str:
+        fragment = self[op_code] = self.template % op_code
+        return fragment
+
+
+_BINARY_OP_SEP = _OpFragments(
+    " %s ", "+ - * / // % ** == != < <= > >= and or & | ^ << >>".split()
+)
+_UNARY_OP_OPEN = _OpFragments("(%s", "+ - ~".split())
+_BOOL_REPR = {True: "True", False: "False"}
+
+
+def _join(nodes: Iterable[astx.AST], sep: str) -> list[Part]:
+    """Return the nodes interleaved with the separator."""
+    items = nodes if isinstance(nodes, list) else list(nodes)
+    if not items:
+        return []
+    parts: list[Part] = [sep] * (2 * len(items) - 1)
+    parts[::2] = items
+    return parts
+
+
+class ASTxPythonTranspiler(ASTxTranspiler):
     """
     Transpiler that converts ASTx nodes to Python code.
 
     Notes
     -----
-    Please keep the visit method in alphabet order according to the node type.
-    The visit method for astx.AST should be the first one.
-    """
+    Please keep the visit methods in alphabet order according to the node
+    type. Each visit method should be registered for its node type(s) with
+    the `register` decorator.
 
-    def __init__(self) -> None:
-        self.indent_level = 0
-        self.indent_str = "    "  # 4 spaces
-
-    def _generate_block(self, block: astx.ASTNodes) -> str:
-        """Generate code for a block of statements with proper indentation."""
-        self.indent_level += 1
-        indent = self.indent_str * self.indent_level
-        lines = [indent + self.visit(node) for node in block.nodes]
-        result = (
-            "\n".join(lines)
-            if lines
-            else self.indent_str * self.indent_level + "pass"
-        )
-        self.indent_level -= 1
-        return result
+    `visit` should only be used where the code of a child node is needed as
+    a string; otherwise return the child node itself as one of the parts.
 
-    @dispatch.abstract
-    def visit(self, expr: astx.AST) -> str:
-        """Translate an ASTx expression."""
-        raise Exception(f"Not implemented yet ({expr}).")
+    Don't decorate the transpiler or its visit methods with `typechecked`:
+    the runtime checks would run for every node of the tree.
+    """
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.AliasExpr) -> str:
+    _type_names: ClassVar[dict[type, str]] = {
+        astx.Complex32: "Complex",
+        astx.Complex64: "Complex",
+        astx.Date: "date",
+        astx.DateTime: "datetime",
+        astx.Float16: "float",
+        astx.Float32: "float",
+        astx.Float64: "float",
+        astx.Int32: "int",
+        astx.Time: "time",
+        astx.Timestamp: "timestamp",
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+        # rendered function headers by prototype id, for the current
+        # translation. The prototype is kept so its id can't be reused.
+        self._proto_cache: dict[int, tuple[astx.FunctionPrototype, str]] = {}
+
+    def _reset(self) -> None:
+        """Clear the state left by the previous translation."""
+        super()._reset()
+        self._proto_cache.clear()
+
+    def _generate_import_assignment(
+        self, target: str, values: list[str]
+    ) -> list[Part]:
+        """Generate the assignment of the imported objects to the target."""
+        # target if one import or target1, target2, etc if multiple imports,
+        # assigned from a tuple
+        if len(values) == 1:
+            return [f"{target} = {values[0]}"]
+        targets = ", ".join(f"{target}{i}" for i in range(1, len(values) + 1))
+        return [f"{targets} = ({', '.join(values)})"]
+
+    @register(astx.AliasExpr)
+    def visit_AliasExpr(self, node: astx.AliasExpr) -> list[Part]:
         """Handle AliasExpr nodes."""
         if node.asname:
-            return f"{node.name} as {node.asname}"
-        return f"{node.name}"
+            return [f"{node.name} as {node.asname}"]
+        return [node.name]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Argument) -> str:
+    @register(astx.Argument)
+    def visit_Argument(self, node: astx.Argument) -> list[Part]:
         """Handle Argument nodes."""
-        type_ = self.visit(node.type_)
-        return f"{node.name}: {type_}"
+        return [f"{node.name}: ", node.type_]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Arguments) -> str:
+    @register(astx.Arguments)
+    def visit_Arguments(self, node: astx.Arguments) -> list[Part]:
         """Handle Argumens nodes."""
-        return ", ".join([self.visit(arg) for arg in node.nodes])
+        return _join(node.nodes, ", ")
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.AssignmentExpr) -> str:
+    @register(astx.AssignmentExpr)
+    def visit_AssignmentExpr(self, node: astx.AssignmentExpr) -> list[Part]:
         """Handle AssignmentExpr nodes."""
-        target_str = " = ".join(self.visit(target) for target in node.targets)
-        return f"{target_str} = {self.visit(node.value)}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.BinaryOp) -> str:
+        parts: list[Part] = []
+        for target in node.targets:
+            parts.append(target)
+            parts.append(" = ")
+        parts.append(node.value)
+        return parts
+
+    @register(astx.BinaryOp)
+    def visit_BinaryOp(self, node: astx.BinaryOp) -> list[Part]:
         """Handle BinaryOp nodes."""
-        lhs = self.visit(node.lhs)
-        rhs = self.visit(node.rhs)
-        return f"({lhs} {node.op_code} {rhs})"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Block) -> str:
-        """Handle Block nodes."""
-        return self._generate_block(node)
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.CaseStmt) -> str:
+        return ["(", node.lhs, _BINARY_OP_SEP[node.op_code], node.rhs, ")"]
+
+    @register(astx.Block)
+    def visit_Block(self, node: astx.Block) -> list[Part]:
+        """Handle Block nodes, indented one level deeper than the parent."""
+        indent = self._indent(self.indent_level + 1)
+        if not node.nodes:
+            return [indent + "pass"]
+        # [INDENT, indent, node, "\n" + indent, node, ..., node, DEDENT]
+        parts: list[Part] = ["\n" + indent] * (2 * len(node.nodes) + 2)
+        parts[0] = Token.INDENT
+        parts[1] = indent
+        parts[2::2] = node.nodes
+        parts[-1] = Token.DEDENT
+        return parts
+
+    @register(astx.CaseStmt)
+    def visit_CaseStmt(self, node: astx.CaseStmt) -> list[Part]:
         """Handle CaseStmt nodes."""
-        cond_str = (
-            self.visit(node.condition) if node.condition is not None else "_"
-        )
-        body_str = self.visit(node.body)
-        return f"case {cond_str}:\n{body_str}"
+        cond = node.condition if node.condition is not None else "_"
+        return ["case ", cond, ":\n", node.body]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.CatchHandlerStmt) -> str:
+    @register(astx.CatchHandlerStmt)
+    def visit_CatchHandlerStmt(
+        self, node: astx.CatchHandlerStmt
+    ) -> list[Part]:
         """Handle CatchHandlerStmt nodes."""
-        types_str = (
-            f" ({' ,'.join(self.visit(t) for t in node.types)})"
-            if node.types
-            else ""
-        )
-        name_str = f" as {self.visit(node.name)}" if node.name else ""
-        body_str = self._generate_block(node.body)
-        return f"except{types_str}{name_str}:\n{body_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ClassDefStmt) -> str:
+        parts: list[Part] = ["except"]
+        if node.types:
+            parts.append(" (")
+            parts.extend(_join(node.types.nodes, " ,"))
+            parts.append(")")
+        if node.name:
+            parts.append(" as ")
+            parts.append(node.name)
+        parts.append(":\n")
+        parts.extend(self.visit_Block(node.body))
+        return parts
+
+    @register(astx.ClassDefStmt)
+    def visit_ClassDefStmt(self, node: astx.ClassDefStmt) -> list[Part]:
         """Handle ClassDefStmt nodes."""
         class_type = "(ABC)" if node.is_abstract else ""
-        return f"class {node.name}{class_type}:\n{self.visit(node.body)}"
+        return [f"class {node.name}{class_type}:\n", node.body]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.EnumDeclStmt) -> str:
+    @register(*_type_names)
+    def visit_DataType(self, node: astx.DataType) -> list[Part]:
+        """Handle data type nodes."""
+        return [self._type_name(type(node))]
+
+    @register(astx.EnumDeclStmt)
+    def visit_EnumDeclStmt(self, node: astx.EnumDeclStmt) -> list[Part]:
         """Handle EnumDeclStmt nodes."""
-        attr_str = "\n    ".join(self.visit(attr) for attr in node.attributes)
-        return f"class {node.name}(Enum):\n    {attr_str}"
+        return [
+            f"class {node.name}(Enum):\n    ",
+            *_join(node.attributes.nodes, "\n    "),
+        ]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ExceptionHandlerStmt) -> str:
+    @register(astx.ExceptionHandlerStmt)
+    def visit_ExceptionHandlerStmt(
+        self, node: astx.ExceptionHandlerStmt
+    ) -> list[Part]:
         """Handle ExceptionHandlerStmt nodes."""
-        body_str = self._generate_block(node.body)
-        handlers_str = "\n".join(
-            self.visit(handler) for handler in node.handlers
-        )
-        finally_str = (
-            f"\n{self.visit(node.finally_handler)}"
-            if node.finally_handler
-            else ""
-        )
-        return f"try:\n{body_str}\n{handlers_str}{finally_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.FinallyHandlerStmt) -> str:
+        parts: list[Part] = ["try:\n"]
+        parts.extend(self.visit_Block(node.body))
+        parts.append("\n")
+        parts.extend(_join(node.handlers.nodes, "\n"))
+        if node.finally_handler:
+            parts.append("\n")
+            parts.append(node.finally_handler)
+        return parts
+
+    @register(astx.FinallyHandlerStmt)
+    def visit_FinallyHandlerStmt(
+        self, node: astx.FinallyHandlerStmt
+    ) -> list[Part]:
         """Handle FinallyHandlerStmt nodes."""
-        body_str = self._generate_block(node.body)
-        return f"finally:\n{body_str}"
+        return ["finally:\n", *self.visit_Block(node.body)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ForRangeLoopExpr) -> str:
+    @register(astx.ForRangeLoopExpr)
+    def visit_ForRangeLoopExpr(
+        self, node: astx.ForRangeLoopExpr
+    ) -> list[Part]:
         """Handle ForRangeLoopExpr nodes."""
         if len(node.body) > 1:
             raise ValueError(
                 "ForRangeLoopExpr in Python just accept 1 node in the body "
                 "attribute."
             )
-        return (
+        return [
             f"result = [{self.visit(node.body).strip()} for "
-            f"{node.variable.name} in range"
-            f"({self.visit(node.start)}, {self.visit(node.end)}, "
-            f"{self.visit(node.step)})]"
-        )
+            f"{node.variable.name} in range(",
+            node.start,
+            ", ",
+            node.end,
+            ", ",
+            node.step,
+            ")]",
+        ]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Function) -> str:
+    @register(astx.Function)
+    def visit_Function(self, node: astx.Function) -> list[Part]:
         """Handle Function nodes."""
-        args = self.visit(node.prototype.args)
-        returns = (
-            f" -> {self.visit(node.prototype.return_type)}"
-            if node.prototype.return_type
-            else ""
-        )
-        header = f"def {node.name}({args}){returns}:"
-        body = self.visit(node.body)
-        return f"{header}\n{body}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.FunctionCall) -> str:
+        prototype = node.prototype
+        cached = self._proto_cache.get(id(prototype))
+        if cached is None:
+            header = f"def {prototype.name}({self.visit(prototype.args)})"
+            if prototype.return_type:
+                header += f" -> {self.visit(prototype.return_type)}"
+            cached = (prototype, f"{header}:\n")
+            self._proto_cache[id(prototype)] = cached
+        return [cached[1], node.body]
+
+    @register(astx.FunctionCall)
+    def visit_FunctionCall(self, node: astx.FunctionCall) -> list[Part]:
         """Handle FunctionCall nodes."""
-        args = ", ".join([self.visit(arg) for arg in node.args])
-        return f"{node.fn.name}({args})"
+        return [f"{node.fn.name}(", *_join(node.args, ", "), ")"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.FunctionReturn) -> str:
+    @register(astx.FunctionReturn)
+    def visit_FunctionReturn(self, node: astx.FunctionReturn) -> list[Part]:
         """Handle FunctionReturn nodes."""
-        value = self.visit(node.value) if node.value else ""
-        return f"return {value}"
+        if node.value:
+            return ["return ", node.value]
+        return ["return "]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Identifier) -> str:
+    @register(astx.Identifier)
+    def visit_Identifier(self, node: astx.Identifier) -> list[Part]:
         """Handle Identifier nodes."""
-        return f"{node.value}"
+        return [f"{node.value}"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.IfExpr) -> str:
+    @register(astx.IfExpr)
+    def visit_IfExpr(self, node: astx.IfExpr) -> list[Part]:
         """Handle IfExpr nodes."""
         if node.else_ is not None and len(node.else_) > 1:
             raise ValueError(
@@ -189,187 +267,138 @@ class ASTxPythonTranspiler:
                 "IfExpr in Python just accept 1 node in the then attribute."
             )
 
-        if_ = self.visit(node.condition)
-        else_ = self.visit(node.else_).strip() if node.else_ else "None"
         then_ = self.visit(node.then).strip()
-        return f"{then_} if {if_} else {else_}"
+        else_ = self.visit(node.else_).strip() if node.else_ else "None"
+        return [f"{then_} if ", node.condition, f" else {else_}"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.IfStmt) -> str:
+    @register(astx.IfStmt)
+    def visit_IfStmt(self, node: astx.IfStmt) -> list[Part]:
         """Handle IfStmt nodes."""
-        else_ = (
-            (f"\nelse:\n{self._generate_block(node.else_)}")
-            if node.else_ is not None
-            else ""
-        )
-
-        return (
-            f"if {self.visit(node.condition)}:"
-            f"\n{self._generate_block(node.then)}"
-            f"{else_}"
-        )
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportFromStmt) -> str:
-        """Handle ImportFromStmt nodes."""
-        names = [self.visit(name) for name in node.names]
-        level_dots = "." * node.level
-        module_str = (
-            f"{level_dots}{node.module}" if node.module else level_dots
-        )
-        names_str = ", ".join(str(name) for name in names)
-        return f"from {module_str} import {names_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportExpr) -> str:
+        parts: list[Part] = ["if ", node.condition, ":\n"]
+        parts.extend(self.visit_Block(node.then))
+        if node.else_ is not None:
+            parts.append("\nelse:\n")
+            parts.extend(self.visit_Block(node.else_))
+        return parts
+
+    @register(astx.ImportExpr)
+    def visit_ImportExpr(self, node: astx.ImportExpr) -> list[Part]:
         """Handle ImportExpr nodes."""
-        names = [self.visit(name) for name in node.names]
-        names_list = []
-        for name in names:
-            str_ = f"__import__('{name}') "
-            names_list.append(str_)
-        names_str = ", ".join(x for x in names_list)
-
-        # name if one import or name1, name2, etc if multiple imports
-        num = [
-            "" if len(names) == 1 else str(n) for n in range(1, len(names) + 1)
-        ]
-        call = ["module" + str(n) for n in num]
-        call_str = ", ".join(x for x in call)
+        values = [_IMPORT_TMPL % self.visit(name) for name in node.names]
+        return self._generate_import_assignment("module", values)
 
-        # assign tuple if multiple imports
-        names_str = (
-            names_str if len(names_list) == 1 else "(" + names_str + ")"
-        )
-
-        return f"{call_str} = {names_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportFromExpr) -> str:
+    @register(astx.ImportFromExpr)
+    def visit_ImportFromExpr(self, node: astx.ImportFromExpr) -> list[Part]:
         """Handle ImportFromExpr nodes."""
-        names = [self.visit(name) for name in node.names]
         level_dots = "." * node.level
         module_str = (
             f"{level_dots}{node.module}" if node.module else level_dots
         )
-        names_list = []
-        for name in names:
-            str_ = (
-                f"getattr(__import__('{module_str}', "
-                f"fromlist=['{name}']), '{name}')"
-            )
-            names_list.append(str_)
-        names_str = ", ".join(x for x in names_list)
-
-        # name if one import or name1, name2, etc if multiple imports
-        num = [
-            "" if len(names) == 1 else str(n) for n in range(1, len(names) + 1)
-        ]
-        call = ["name" + str(n) for n in num]
-        call_str = ", ".join(x for x in call)
-
-        # assign tuple if multiple imports
-        names_str = (
-            names_str if len(names_list) == 1 else "(" + names_str + ")"
-        )
-
-        return f"{call_str} = {names_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportStmt) -> str:
-        """Handle ImportStmt nodes."""
-        names = [self.visit(name) for name in node.names]
-        names_str = ", ".join(x for x in names)
-        return f"import {names_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportFromStmt) -> str:
+        values = []
+        for alias in node.names:
+            name = self.visit(alias)
+            values.append(_IMPORT_FROM_TMPL % (module_str, name, name))
+        return self._generate_import_assignment("name", values)
+
+    @register(astx.ImportFromStmt)
+    def visit_ImportFromStmt(self, node: astx.ImportFromStmt) -> list[Part]:
         """Handle ImportFromStmt nodes."""
-        names = [self.visit(name) for name in node.names]
         level_dots = "." * node.level
         module_str = (
             f"{level_dots}{node.module}" if node.module else level_dots
         )
-        names_str = ", ".join(str(name) for name in names)
-        return f"from {module_str} import {names_str}"
+        return [f"from {module_str} import ", *_join(node.names, ", ")]
+
+    @register(astx.ImportStmt)
+    def visit_ImportStmt(self, node: astx.ImportStmt) -> list[Part]:
+        """Handle ImportStmt nodes."""
+        return ["import ", *_join(node.names, ", ")]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LambdaExpr) -> str:
+    @register(astx.LambdaExpr)
+    def visit_LambdaExpr(self, node: astx.LambdaExpr) -> list[Part]:
         """Handle LambdaExpr nodes."""
         params_str = ", ".join(param.name for param in node.params)
-        return f"lambda {params_str}: {self.visit(node.body)}"
+        return [f"lambda {params_str}: ", node.body]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralBoolean) -> str:
+    @register(astx.LiteralBoolean)
+    def visit_LiteralBoolean(self, node: astx.LiteralBoolean) -> list[Part]:
         """Handle LiteralBoolean nodes."""
-        return "True" if node.value else "False"
+        return [_BOOL_REPR[node.value]]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralComplex32) -> str:
+    @register(astx.LiteralComplex32)
+    def visit_LiteralComplex32(
+        self, node: astx.LiteralComplex32
+    ) -> list[Part]:
         """Handle LiteralComplex32 nodes."""
         real = node.value[0]
         imag = node.value[1]
-        return f"complex({real}, {imag})"
+        return [f"complex({real}, {imag})"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralComplex) -> str:
+    @register(astx.LiteralComplex)
+    def visit_LiteralComplex(self, node: astx.LiteralComplex) -> list[Part]:
         """Handle LiteralComplex nodes."""
         real = node.value[0]
         imag = node.value[1]
-        return f"complex({real}, {imag})"
+        return [f"complex({real}, {imag})"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralComplex64) -> str:
+    @register(astx.LiteralComplex64)
+    def visit_LiteralComplex64(
+        self, node: astx.LiteralComplex64
+    ) -> list[Part]:
         """Handle LiteralComplex64 nodes."""
         real = node.value[0]
         imag = node.value[1]
-        return f"complex({real}, {imag})"
+        return [f"complex({real}, {imag})"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralFloat16) -> str:
+    @register(astx.LiteralFloat16)
+    def visit_LiteralFloat16(self, node: astx.LiteralFloat16) -> list[Part]:
         """Handle LiteralFloat nodes."""
-        return str(node.value)
+        return [str(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralFloat32) -> str:
+    @register(astx.LiteralFloat32)
+    def visit_LiteralFloat32(self, node: astx.LiteralFloat32) -> list[Part]:
         """Handle LiteralFloat nodes."""
-        return str(node.value)
+        return [str(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralFloat64) -> str:
+    @register(astx.LiteralFloat64)
+    def visit_LiteralFloat64(self, node: astx.LiteralFloat64) -> list[Part]:
         """Handle LiteralFloat nodes."""
-        return str(node.value)
+        return [str(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralInt32) -> str:
+    @register(astx.LiteralInt32)
+    def visit_LiteralInt32(self, node: astx.LiteralInt32) -> list[Part]:
         """Handle LiteralInt32 nodes."""
-        return str(node.value)
+        return [str(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralString) -> str:
+    @register(astx.LiteralString)
+    def visit_LiteralString(self, node: astx.LiteralString) -> list[Part]:
         """Handle LiteralUTF8String nodes."""
-        return repr(node.value)
+        return [repr(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralUTF8String) -> str:
+    @register(astx.LiteralUTF8String)
+    def visit_LiteralUTF8String(
+        self, node: astx.LiteralUTF8String
+    ) -> list[Part]:
         """Handle LiteralUTF8String nodes."""
-        return repr(node.value)
+        return [repr(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralUTF8Char) -> str:
+    @register(astx.LiteralUTF8Char)
+    def visit_LiteralUTF8Char(self, node: astx.LiteralUTF8Char) -> list[Part]:
         """Handle LiteralUTF8Char nodes."""
-        return repr(node.value)
+        return [repr(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(
+    @register(astx.StructDeclStmt, astx.StructDefStmt)
+    def visit_StructDeclStmt(
         self, node: Union[astx.StructDeclStmt, astx.StructDefStmt]
-    ) -> str:
+    ) -> list[Part]:
         """Handle StructDeclStmt and StructDefStmt nodes."""
-        attrs_str = "\n    ".join(self.visit(attr) for attr in node.attributes)
-        return f"@dataclass \nclass {node.name}:\n    {attrs_str}"
+        return [
+            f"@dataclass \nclass {node.name}:\n    ",
+            *_join(node.attributes.nodes, "\n    "),
+        ]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.SubscriptExpr) -> str:
+    @register(astx.SubscriptExpr)
+    def visit_SubscriptExpr(self, node: astx.SubscriptExpr) -> list[Part]:
         """Handle SubscriptExpr nodes."""
         lower_str = (
             str(node.lower.value)
@@ -386,157 +415,133 @@ class ASTxPythonTranspiler:
             if not isinstance(node.step, astx.LiteralNone)
             else ""
         )
-        return f"{node.value.name}[{lower_str}{upper_str}{step_str}]"
+        return [f"{node.value.name}[{lower_str}{upper_str}{step_str}]"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.SwitchStmt) -> str:
+    @register(astx.SwitchStmt)
+    def visit_SwitchStmt(self, node: astx.SwitchStmt) -> list[Part]:
         """Handle SwitchStmt nodes."""
-        cases_visited = self._generate_block(cast(astx.Block, node.cases))
-        return f"match {self.visit(node.value)}:\n{cases_visited}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Complex32) -> str:
-        """Handle Complex32 nodes."""
-        return "Complex"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Complex64) -> str:
-        """Handle Complex64 nodes."""
-        return "Complex"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Float16) -> str:
-        """Handle Float nodes."""
-        return "float"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Float32) -> str:
-        """Handle Float nodes."""
-        return "float"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Float64) -> str:
-        """Handle Float nodes."""
-        return "float"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Int32) -> str:
-        """Handle Int32 nodes."""
-        return "int"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.TypeCastExpr) -> str:
+        return [
+            "match ",
+            node.value,
+            ":\n",
+            *self.visit_Block(cast(astx.Block, node.cases)),
+        ]
+
+    @register(astx.TypeCastExpr)
+    def visit_TypeCastExpr(self, node: astx.TypeCastExpr) -> list[Part]:
         """Handle TypeCastExpr nodes."""
-        return f"cast({self.visit(node.target_type)}, {node.expr.name})"
+        return ["cast(", node.target_type, f", {node.expr.name})"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ThrowStmt) -> str:
+    @register(astx.ThrowStmt)
+    def visit_ThrowStmt(self, node: astx.ThrowStmt) -> list[Part]:
         """Handle ThrowStmt nodes."""
-        exception_str = (
-            f" {self.visit(node.exception)}" if node.exception else ""
-        )
-        return f"raise{exception_str}"
+        if node.exception:
+            return ["raise ", node.exception]
+        return ["raise"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.UnaryOp) -> str:
+    @register(astx.UnaryOp)
+    def visit_UnaryOp(self, node: astx.UnaryOp) -> list[Part]:
         """Handle UnaryOp nodes."""
-        operand = self.visit(node.operand)
-        return f"({node.op_code}{operand})"
+        return [_UNARY_OP_OPEN[node.op_code], node.operand, ")"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.UTF8Char) -> str:
+    @register(astx.UTF8Char)
+    def visit_UTF8Char(self, node: astx.UTF8Char) -> list[Part]:
         """Handle UTF8Char nodes."""
-        return repr(node.value)
+        return [repr(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.UTF8String) -> str:
+    @register(astx.UTF8String)
+    def visit_UTF8String(self, node: astx.UTF8String) -> list[Part]:
         """Handle UTF8String nodes."""
-        return repr(node.value)
+        return [repr(node.value)]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Variable) -> str:
+    @register(astx.Variable)
+    def visit_Variable(self, node: astx.Variable) -> list[Part]:
         """Handle Variable nodes."""
-        return node.name
+        return [node.name]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.VariableAssignment) -> str:
+    @register(astx.VariableAssignment)
+    def visit_VariableAssignment(
+        self, node: astx.VariableAssignment
+    ) -> list[Part]:
         """Handle VariableAssignment nodes."""
-        target = node.name
-        value = self.visit(node.value)
-        return f"{target} = {value}"
+        return [f"{node.name} = ", node.value]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.VariableDeclaration) -> str:
+    @register(astx.VariableDeclaration)
+    def visit_VariableDeclaration(
+        self, node: astx.VariableDeclaration
+    ) -> list[Part]:
         """Handle VariableDeclaration nodes."""
-        value = self.visit(node.value)
-        return f"{node.name}: {node.value.type_.__class__.__name__} = {value}"
+        type_name = node.value.type_.__class__.__name__
+        return [f"{node.name}: {type_name} = ", node.value]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.WalrusOp) -> str:
+    @register(astx.WalrusOp)
+    def visit_WalrusOp(self, node: astx.WalrusOp) -> list[Part]:
         """Handle Walrus operator."""
-        return f"({self.visit(node.lhs)} := {self.visit(node.rhs)})"
+        return ["(", node.lhs, " := ", node.rhs, ")"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.WhileExpr) -> str:
+    @register(astx.WhileExpr)
+    def visit_WhileExpr(self, node: astx.WhileExpr) -> list[Part]:
         """Handle WhileExpr nodes."""
         if len(node.body) > 1:
             raise ValueError(
                 "WhileExpr in Python just accept 1 node in the body attribute."
             )
 
-        condition = self.visit(node.condition)
         body = self.visit(node.body).strip()
-        return f"[{body} for _ in iter(lambda: {condition}, False)]"
+        return [f"[{body} for _ in iter(lambda: ", node.condition, ", False)]"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.WhileStmt) -> str:
+    @register(astx.WhileStmt)
+    def visit_WhileStmt(self, node: astx.WhileStmt) -> list[Part]:
         """Handle WhileStmt nodes."""
-        condition = self.visit(node.condition)
-        body = self._generate_block(node.body)
-        return f"while {condition}:\n{body}"
+        return [
+            "while ",
+            node.condition,
+            ":\n",
+            *self.visit_Block(node.body),
+        ]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.YieldExpr) -> str:
+    @register(astx.YieldExpr)
+    def visit_YieldExpr(self, node: astx.YieldExpr) -> list[Part]:
         """Handle YieldExpr nodes."""
-        value = self.visit(node.value) if node.value else ""
-        return f"yield {value}".strip()
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Date) -> str:
-        """Handle Date nodes."""
-        return "date"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Time) -> str:
-        """Handle Time nodes."""
-        return "time"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Timestamp) -> str:
-        """Handle Timestamp nodes."""
-        return "timestamp"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.DateTime) -> str:
-        """Handle DateTime nodes."""
-        return "datetime"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralDate) -> str:
+        if node.value:
+            return ["yield ", node.value]
+        return ["yield"]
+
+    @register(astx.LiteralDate)
+    def visit_LiteralDate(self, node: astx.LiteralDate) -> list[Part]:
         """Handle LiteralDate nodes."""
-        return f"datetime.strptime({node.value!r}, '%Y-%m-%d').date()"
+        return [f"datetime.strptime({node.value!r}, '%Y-%m-%d').date()"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralTime) -> str:
+    @register(astx.LiteralTime)
+    def visit_LiteralTime(self, node: astx.LiteralTime) -> list[Part]:
         """Handle LiteralTime nodes."""
-        return f"datetime.strptime({node.value!r}, '%H:%M:%S').time()"
+        return [f"datetime.strptime({node.value!r}, '%H:%M:%S').time()"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralTimestamp) -> str:
+    @register(astx.LiteralTimestamp)
+    def visit_LiteralTimestamp(
+        self, node: astx.LiteralTimestamp
+    ) -> list[Part]:
         """Handle LiteralTimestamp nodes."""
-        return f"datetime.strptime({node.value!r}, '%Y-%m-%d %H:%M:%S')"
+        return [f"datetime.strptime({node.value!r}, '%Y-%m-%d %H:%M:%S')"]
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralDateTime) -> str:
+    @register(astx.LiteralDateTime)
+    def visit_LiteralDateTime(self, node: astx.LiteralDateTime) -> list[Part]:
         """Handle LiteralDateTime nodes."""
-        return f"datetime.strptime({node.value!r}, '%Y-%m-%dT%H:%M:%S')"
+        return [f"datetime.strptime({node.value!r}, '%Y-%m-%dT%H:%M:%S')"]
+
+
+_local = threading.local()
+
+
+def transpile(tree: astx.AST) -> str:
+    """
+    Translate an ASTx tree into Python code.
+
+    This is the preferred way to generate Python code: each thread creates
+    one `ASTxPythonTranspiler` on its first call and reuses it afterwards.
+    """
+    transpiler: Optional[ASTxPythonTranspiler]
+    transpiler = getattr(_local, "transpiler", None)
+    if transpiler is None:
+        transpiler = _local.transpiler = ASTxPythonTranspiler()
+    return transpiler.transpile(tree)
@@ -0,0 +1,48 @@
+"""Tests for the names exported by the astx package."""
+
+import subprocess
+import sys
+
+import astx
+
+SUBMODULES = [
+    "base",
+    "blocks",
+    "callables",
+    "classes",
+    "exceptions",
+    "flows",
+    "literals",
+    "mixes",
+    "modifiers",
+    "operators",
+    "packages",
+    "subscript",
+    "symbol_table",
+    "tools",
+    "types",
+    "variables",
+]
+
+
+def test_submodule_attributes() -> None:
+    """Test that the submodules are available right after `import astx`."""
+    # a new interpreter, so no other test has imported the submodules yet
+    code = (
+        "import types, astx\n"
+        f"for name in {SUBMODULES!r}:\n"
+        "    assert isinstance(getattr(astx, name), types.ModuleType), name"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_all_names_exist() -> None:
+    """Test that every name in `__all__` can be loaded from the package."""
+    for name in astx.__all__:
+        assert getattr(astx, name) is not None, name
+
+
+def test_all_lazy_names_exported() -> None:
+    """Test that every lazily loaded name is listed in `__all__`."""
+    assert set(astx._LAZY_IMPORTS) <= set(astx.__all__)
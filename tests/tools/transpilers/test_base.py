@@ -0,0 +1,76 @@
+"""Test the base class for transpilers."""
+
+import sys
+
+import astx
+
+from astx.tools.transpilers.base import ASTxTranspiler, Part, register
+from astx.tools.transpilers.python import ASTxPythonTranspiler
+
+
+class CustomVariable(astx.Variable):
+    """Variable subclass without a dedicated handler."""
+
+
+class UpperVariableTranspiler(ASTxPythonTranspiler):
+    """Transpiler that overrides the Variable handler without `register`."""
+
+    def visit_Variable(self, node: astx.Variable) -> list[Part]:
+        """Handle Variable nodes."""
+        return [node.name.upper()]
+
+
+def test_register_handlers() -> None:
+    """Test that registered visit methods are used for their node types."""
+
+    class NameTranspiler(ASTxTranspiler):
+        """Minimal transpiler."""
+
+        @register(astx.Variable, astx.Identifier)
+        def visit_name(self, node: astx.AST) -> list[Part]:
+            """Handle Variable and Identifier nodes."""
+            return ["name"]
+
+    transpiler = NameTranspiler()
+
+    assert transpiler.transpile(astx.Variable(name="x")) == "name"
+    assert transpiler.transpile(astx.Identifier("x")) == "name"
+    assert NameTranspiler._registered.keys() == {
+        astx.Variable,
+        astx.Identifier,
+    }
+
+
+def test_override_handler() -> None:
+    """Test that subclasses can override an inherited visit method."""
+    node = astx.BinaryOp(
+        op_code="+",
+        lhs=astx.Variable(name="x"),
+        rhs=CustomVariable(name="y"),
+    )
+
+    assert ASTxPythonTranspiler().transpile(node) == "(x + y)"
+    assert UpperVariableTranspiler().transpile(node) == "(X + Y)"
+    # node types resolved through the MRO are cached per class
+    assert ASTxPythonTranspiler().transpile(node) == "(x + y)"
+
+
+def test_deep_tree() -> None:
+    """Test that trees deeper than the recursion limit are transpiled."""
+    depth = sys.getrecursionlimit() + 100
+    node: astx.DataType = astx.Variable(name="x")
+    for _ in range(depth):
+        node = astx.BinaryOp(op_code="+", lhs=node, rhs=astx.LiteralInt32(1))
+
+    code = ASTxPythonTranspiler().transpile(node)
+
+    assert code == "(" * depth + "x" + " + 1)" * depth
+
+
+def test_data_type_class() -> None:
+    """Test that data types are transpiled from classes and instances."""
+    transpiler = ASTxPythonTranspiler()
+
+    assert transpiler.visit(astx.Int32) == "int"
+    assert transpiler.visit(astx.Int32()) == "int"
+    assert transpiler.visit(astx.DateTime) == "datetime"
@@ -2,6 +2,7 @@
 
 import ast
 import sys
+import threading
 
 import astx
 import pytest
@@ -274,6 +275,13 @@ def test_literal_int32() -> None:
     assert generated_code == expected_code, "generated_code != expected_code"
 
 
+def test_literal_boolean() -> None:
+    """Test astx.LiteralBoolean."""
+    # Generate Python code for both values
+    assert translate(astx.LiteralBoolean(value=True)) == "True"
+    assert translate(astx.LiteralBoolean(value=False)) == "False"
+
+
 def test_literal_float16() -> None:
     """Test astx.LiteralFloat16."""
     # Create a LiteralFloat16 node
@@ -1152,3 +1160,158 @@ def test_transpiler_exception_handler_stmt_with_finally() -> None:
     assert generated_code == expected_code, (
         f"Expected '{expected_code}', but got '{generated_code}'"
     )
+
+
+def test_transpiler_dispatch_subclass() -> None:
+    """Test that subclasses use the handler of the closest parent class."""
+
+    class CustomVariable(astx.Variable):
+        """Variable subclass without a dedicated handler."""
+
+    generated_code = translate(CustomVariable(name="x"))
+    expected_code = "x"
+
+    assert generated_code == expected_code, (
+        f"Expected '{expected_code}', but got '{generated_code}'"
+    )
+
+
+def test_transpiler_dispatch_not_implemented() -> None:
+    """Test that nodes without a handler raise an error."""
+    with pytest.raises(Exception, match="Not implemented yet"):
+        transpiler.visit(astx.GotoStmt(astx.Identifier("label")))
+
+
+def test_transpiler_transpile() -> None:
+    """Test that `transpile` generates the same code as `visit`."""
+    body = astx.Block()
+    body.append(
+        astx.FunctionReturn(
+            value=astx.BinaryOp(
+                op_code="+",
+                lhs=astx.Variable(name="x"),
+                rhs=astx.LiteralInt32(1),
+            )
+        )
+    )
+    fn = astx.Function(
+        prototype=astx.FunctionPrototype(
+            name="inc",
+            args=astx.Arguments(astx.Argument(name="x", type_=astx.Int32())),
+            return_type=astx.Int32(),
+        ),
+        body=body,
+    )
+
+    generated_code = astx2py.ASTxPythonTranspiler().transpile(fn)
+    expected_code = "def inc(x: int) -> int:\n    return (x + 1)"
+
+    assert generated_code == expected_code, (
+        f"Expected '{expected_code}', but got '{generated_code}'"
+    )
+    assert generated_code == translate(fn)
+
+
+def test_transpiler_shared_prototype() -> None:
+    """Test functions that share the same prototype."""
+    prototype = astx.FunctionPrototype(
+        name="one",
+        args=astx.Arguments(astx.Argument(name="x", type_=astx.Int32())),
+        return_type=astx.Int32(),
+    )
+    block = astx.Block()
+    for _ in range(2):
+        body = astx.Block()
+        body.append(astx.FunctionReturn(value=astx.LiteralInt32(1)))
+        block.append(astx.Function(prototype=prototype, body=body))
+    transpiler = astx2py.ASTxPythonTranspiler()
+
+    function_code = "def one(x: int) -> int:\n        return 1"
+    assert transpiler.transpile(block) == (
+        f"    {function_code}\n    {function_code}"
+    )
+
+    # the rendered prototypes are not kept between translations
+    prototype.args.append(astx.Argument(name="y", type_=astx.Int32()))
+    assert transpiler.visit(block.nodes[0]).startswith(
+        "def one(x: int, y: int) -> int:"
+    )
+
+
+def test_transpiler_visit_after_error() -> None:
+    """Test that a failed visit doesn't leave state for the next one."""
+    then = astx.Block()
+    then.append(astx.LiteralInt32(1))
+    then.append(astx.LiteralInt32(2))
+    bad_body = astx.Block()
+    bad_body.append(
+        astx.IfExpr(condition=astx.LiteralBoolean(True), then=then)
+    )
+    bad_fn = astx.Function(
+        prototype=astx.FunctionPrototype(
+            name="bad", args=astx.Arguments(), return_type=astx.Int32()
+        ),
+        body=bad_body,
+    )
+    body = astx.Block()
+    body.append(astx.FunctionReturn(value=astx.LiteralInt32(1)))
+    fn = astx.Function(
+        prototype=astx.FunctionPrototype(
+            name="f", args=astx.Arguments(), return_type=astx.Int32()
+        ),
+        body=body,
+    )
+    transpiler = astx2py.ASTxPythonTranspiler()
+
+    with pytest.raises(ValueError):
+        transpiler.visit(bad_fn)
+
+    assert transpiler.visit(fn) == "def f() -> int:\n    return 1"
+    fn.prototype.args.append(astx.Argument(name="y", type_=astx.Int32()))
+    assert transpiler.visit(fn) == "def f(y: int) -> int:\n    return 1"
+    assert transpiler._buf == []
+    assert transpiler.indent_level == 0
+
+
+def test_transpile_function() -> None:
+    """Test the module-level `transpile` function."""
+    node = astx.BinaryOp(
+        op_code="*", lhs=astx.Variable(name="x"), rhs=astx.LiteralInt32(2)
+    )
+    results: list[str] = []
+    thread = threading.Thread(
+        target=lambda: results.append(astx2py.transpile(node))
+    )
+    thread.start()
+    thread.join()
+
+    assert astx2py.transpile(node) == "(x * 2)"
+    # the transpiler is reused and reset between calls
+    assert astx2py.transpile(node) == "(x * 2)"
+    assert results == ["(x * 2)"]
+
+
+def test_transpiler_unary_op() -> None:
+    """Test astx.UnaryOp."""
+    unary_op = astx.UnaryOp(op_code="-", operand=astx.Variable(name="x"))
+
+    generated_code = translate(unary_op)
+    expected_code = "(-x)"
+
+    assert generated_code == expected_code, (
+        f"Expected '{expected_code}', but got '{generated_code}'"
+    )
+
+
+def test_transpiler_binary_op_custom_op_code() -> None:
+    """Test astx.BinaryOp with an operator code not known in advance."""
+    binary_op = astx.BinaryOp(
+        op_code="@", lhs=astx.Variable(name="a"), rhs=astx.Variable(name="b")
+    )
+
+    generated_code = translate(binary_op)
+    expected_code = "(a @ b)"
+
+    assert generated_code == expected_code, (
+        f"Expected '{expected_code}', but got '{generated_code}'"
+    )